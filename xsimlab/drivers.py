@@ -23,6 +23,8 @@ class CheckDimsOption(Enum):
 class RuntimeContext(Mapping[str, Any]):
     """A mapping providing runtime information at the current time step."""
 
+    __slots__ = ("_context",)
+
     _context_keys = (
         "batch_size",
         "batch",
@@ -338,6 +340,8 @@ def _run(
     in_vars = _get_input_vars(ds_init, model)
     model.update_state(in_vars, validate=validate_inputs, ignore_static=True)
 
+    flushed = False
+
     try:
         model.execute("initialize", rt_context, **execute_kwargs)
 
@@ -370,8 +374,17 @@ def _run(
                 break
 
         store.write_output_vars(batch, -1, model=model)
+        flushed = True
+        store.flush(batch)
         store.write_index_vars(model=model)
     except Exception:
+        # still write the output values saved until the error occurred
+        # (don't retry a failed flush and don't hide the original error)
+        if not flushed:
+            try:
+                store.flush(batch)
+            except Exception:
+                pass
         raise
     finally:
         model.execute("finalize", rt_context, **execute_kwargs)
@@ -1,4 +1,6 @@
 """Formatting utils and functions."""
+import functools
+import io
 import textwrap
 
 import attr
@@ -7,8 +9,21 @@ from .utils import variables_dict
 from .variable import VarIntent, VarType
 
 
+@functools.lru_cache(maxsize=None)
+def _get_text_wrapper(width):
+    return textwrap.TextWrapper(width=width)
+
+
+def _indent(text, prefix):
+    # equivalent to textwrap.indent (i.e., skip whitespace-only lines)
+    return "".join(
+        prefix + line if line.strip() else line for line in text.splitlines(True)
+    )
+
+
 def _calculate_col_width(col_items):
-    max_name_length = max((len(s) for s in col_items)) if col_items else 0
+    # single pass, also works with iterators
+    max_name_length = max((len(s) for s in col_items), default=0)
     col_width = max(max_name_length, 7) + 6
     return col_width
 
@@ -18,8 +33,7 @@ def pretty_print(s, numchars):
     padding with trailing spaces or truncating with ellipses as
     necessary.
     """
-    s = maybe_truncate(s, numchars)
-    return s + " " * max(numchars - len(s), 0)
+    return maybe_truncate(s, numchars).ljust(numchars)
 
 
 def maybe_truncate(s, maxlen=500):
@@ -35,8 +49,9 @@ def wrap_indent(text, start="", length=None):
     return start + indent.join(x for x in text.splitlines())
 
 
-def format_var_dims(var):
-    var_dims = " or ".join([str(d) for d in var.metadata["dims"]])
+@functools.lru_cache(maxsize=None)
+def format_dims(dims):
+    var_dims = " or ".join(str(d) for d in dims)
 
     if var_dims == "()":
         var_dims = ""
@@ -82,10 +97,10 @@ def _summarize_var(var, process, col_width):
         var_info = var.metadata["description"]
 
     else:
-        var_dims = format_var_dims(var)
+        var_dims = format_dims(var.metadata["dims"])
 
         if var_dims:
-            var_info = " ".join([var_dims, var.metadata["description"]])
+            var_info = f"{var_dims} {var.metadata['description']}"
         else:
             var_info = var.metadata["description"]
 
@@ -103,9 +118,8 @@ def var_details(var, max_line_length=70):
     subsections = []
 
     if meta.get("description", False):
-        wrapped_descr = textwrap.fill(
-            meta["description"].capitalize(), width=max_line_length
-        )
+        wrapper = _get_text_wrapper(max_line_length)
+        wrapped_descr = wrapper.fill(meta["description"].capitalize())
         subsections.append(wrapped_descr)
     else:
         subsections.append("No description given")
@@ -159,13 +173,11 @@ def add_attribute_section(process, placeholder="{{attributes}}"):
 
     for vname, var in variables_dict(process).items():
         var_header = f"{vname} : {data_type}"
-        var_content = textwrap.indent(var_details(var, max_line_length=62), " " * 4)
+        var_content = _indent(var_details(var, max_line_length=62), " " * 4)
 
         fmt_vars.append(f"{var_header}\n{var_content}")
 
-    fmt_section = textwrap.indent(
-        "Attributes\n" "----------\n" + "\n".join(fmt_vars), " " * 4
-    )
+    fmt_section = _indent("Attributes\n" "----------\n" + "\n".join(fmt_vars), " " * 4)
 
     current_doc = process.__doc__ or ""
 
@@ -187,38 +199,29 @@ def repr_process(process):
 
     header = f"<{process_cls.__name__} {process_name} (xsimlab process)>"
 
-    variables = variables_dict(process_cls)
+    # (name, variable) pairs computed at process class creation
+    variables = process_cls.__xsimlab_vars__
 
-    col_width = _calculate_col_width(variables)
+    col_width = _calculate_col_width(var_name for var_name, _ in variables)
 
-    var_section_summary = "Variables:"
-    var_section_details = "\n".join(
-        [_summarize_var(var, process, col_width) for var in variables.values()]
-    )
-    if not var_section_details:
-        var_section_details = "    *empty*"
+    buf = io.StringIO()
+    buf.write(header + "\n")
 
-    stages_implemented = [
-        "    {}".format(s) for s in process.__xsimlab_executor__.stages
-    ]
+    buf.write("Variables:\n")
+    for _, var in variables:
+        buf.write(_summarize_var(var, process, col_width) + "\n")
+    if not variables:
+        buf.write("    *empty*\n")
 
-    stages_section_summary = "Simulation stages:"
-    if stages_implemented:
-        stages_section_details = "\n".join(stages_implemented)
-    else:
-        stages_section_details = "    *no stage implemented*"
-
-    process_repr = "\n".join(
-        [
-            header,
-            var_section_summary,
-            var_section_details,
-            stages_section_summary,
-            stages_section_details,
-        ]
-    )
+    stages_implemented = process.__xsimlab_executor__.stages
 
-    return process_repr + "\n"
+    buf.write("Simulation stages:\n")
+    for stage in stages_implemented:
+        buf.write(f"    {stage}\n")
+    if not stages_implemented:
+        buf.write("    *no stage implemented*\n")
+
+    return buf.getvalue()
 
 
 def repr_model(model):
@@ -231,23 +234,18 @@ def repr_model(model):
     if not n_processes:
         return header + "\n"
 
-    col_width = _calculate_col_width([var_name for _, var_name in model.input_vars])
+    col_width = _calculate_col_width(var_name for _, var_name in model.input_vars)
 
-    sections = []
+    buf = io.StringIO()
+    buf.write(header + "\n")
 
     for p_name, p_obj in model.items():
-        p_section = p_name
-
-        p_input_vars = model.input_vars_dict.get(p_name, [])
-        input_var_lines = []
-
-        for var_name in p_input_vars:
-            var = variables_dict(type(p_obj))[var_name]
-            input_var_lines.append(_summarize_var(var, p_obj, col_width))
+        buf.write(p_name + "\n")
 
-        if input_var_lines:
-            p_section += "\n" + "\n".join(input_var_lines)
+        p_variables = dict(type(p_obj).__xsimlab_vars__)
 
-        sections.append(p_section)
+        for var_name in model.input_vars_dict.get(p_name, []):
+            var = p_variables[var_name]
+            buf.write(_summarize_var(var, p_obj, col_width) + "\n")
 
-    return header + "\n" + "\n".join(sections) + "\n"
+    return buf.getvalue()
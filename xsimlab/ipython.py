@@ -4,7 +4,7 @@ from IPython.core.magic import Magics, magics_class, line_magic
 from IPython.core import magic_arguments
 import attr
 
-from .formatting import format_var_dims
+from .formatting import format_dims
 from .model import Model
 from .utils import variables_dict
 
@@ -37,7 +37,7 @@ def format_var_comment(var, verbose=0):
         comment += "\n"
 
     if verbose > 1:
-        var_dims = format_var_dims(var)
+        var_dims = format_dims(var.metadata["dims"])
         if var_dims:
             comment += f"#     dimensions: {var_dims}\n"
         if var.metadata["static"]:
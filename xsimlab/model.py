@@ -401,6 +401,17 @@ class _ModelBuilder:
 
         return {k: list(v) for k, v in processes_to_validate.items()}
 
+    def get_validated_attributes(self):
+        """Return a dictionary where keys are each process of the model and
+        values are tuples of all attributes (variables or not) that have a
+        validator.
+
+        """
+        return {
+            p_name: tuple(a for a in attr.fields(type(p_obj)) if a.validator)
+            for p_name, p_obj in self._processes_obj.items()
+        }
+
     def get_process_dependencies(self):
         """Return a dictionary where keys are each process of the model and
         values are lists of the names of dependent processes (or empty
@@ -571,6 +582,7 @@ class Model(AttrMapping):
         self._input_vars_dict = None
 
         self._processes_to_validate = builder.get_processes_to_validate()
+        self._validated_attrs = builder.get_validated_attributes()
 
         self._dep_processes = builder.get_process_dependencies()
         self._processes = builder.get_sorted_processes()
@@ -769,9 +781,17 @@ class Model(AttrMapping):
             Variable key in the form of a ``('process_name', 'var_name')``
             tuple.
 
+        Returns
+        -------
+        value : object
+            The updated value in cache.
+
         """
         p_name, v_name = var_key
-        self._var_cache[var_key]["value"] = getattr(self._processes[p_name], v_name)
+        value = getattr(self._processes[p_name], v_name)
+        self._var_cache[var_key]["value"] = value
+
+        return value
 
     def validate(self, p_names=None):
         """Run the variable validators of all or some of the processes
@@ -784,13 +804,18 @@ class Model(AttrMapping):
             validators are run for all processes.
 
         """
+        # same as attr.validate, but skip attributes that have no validator
+        if not attr.get_run_validators():
+            return
+
         if p_names is None:
-            processes = self._processes.values()
-        else:
-            processes = [self._processes[pn] for pn in p_names]
+            p_names = self._processes
+
+        for pn in p_names:
+            p_obj = self._processes[pn]
 
-        for p_obj in processes:
-            attr.validate(p_obj)
+            for a in self._validated_attrs[pn]:
+                a.validator(p_obj, a, getattr(p_obj, a.name))
 
     def _call_hooks(self, hooks, runtime_context, stage, level, trigger):
         try:
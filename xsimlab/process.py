@@ -161,6 +161,9 @@ def _dummy_converter(value):
     return value
 
 
+_NOT_CACHED = object()
+
+
 def _make_property_variable(var):
     """Create a property for a variable or a foreign variable (after
     some sanity checks).
@@ -181,13 +184,15 @@ def _make_property_variable(var):
 
     def get_on_demand(self):
         key = self.__xsimlab_od_keys__[var_name]
-        try:
-            # get from cache
-            return self.__xsimlab_state__[key]
-        except KeyError:
-            p_name, v_name = key
-            p_obj = self.__xsimlab_model__._processes[p_name]
-            return getattr(p_obj, v_name)
+
+        # get from cache (avoid raising/catching an error at each cache miss)
+        value = self.__xsimlab_state__.get(key, _NOT_CACHED)
+        if value is not _NOT_CACHED:
+            return value
+
+        p_name, v_name = key
+        p_obj = self.__xsimlab_model__._processes[p_name]
+        return getattr(p_obj, v_name)
 
     def put_in_state(self, value):
         key = self.__xsimlab_state_keys__[var_name]
@@ -371,6 +376,8 @@ class _RuntimeMethodExecutor:
 
     """
 
+    __slots__ = ("meth", "args")
+
     def __init__(self, meth, args=None):
         self.meth = meth
 
@@ -506,6 +513,8 @@ def _get_out_variables(cls):
 class _ProcessExecutor:
     """Used to execute a process during simulation runtime."""
 
+    __slots__ = ("cls", "runtime_executors", "out_vars")
+
     def __init__(self, cls):
         self.cls = cls
         self.runtime_executors = _create_runtime_executors(cls)
@@ -618,6 +627,7 @@ class _ProcessBuilder:
         setattr(p_cls, "__repr__", repr_process)
         setattr(p_cls, "__xsimlab_process__", True)
         setattr(p_cls, "__xsimlab_executor__", _ProcessExecutor(p_cls))
+        setattr(p_cls, "__xsimlab_vars__", tuple(variables_dict(p_cls).items()))
 
         return p_cls
 
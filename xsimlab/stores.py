@@ -1,5 +1,6 @@
 from collections.abc import MutableMapping
-from typing import Any, Dict, Optional, Tuple, Union
+import functools
+from typing import Any, Dict, List, Optional, Tuple, Union
 import warnings
 
 import numpy as np
@@ -18,12 +19,12 @@ _DIMENSION_KEY = "_ARRAY_DIMENSIONS"
 
 
 def _get_var_info(
-    dataset: xr.Dataset, model: Model, encoding: EncodingDict
+    output_vars: Dict[VarKey, Optional[str]], model: Model, encoding: EncodingDict
 ) -> Dict[VarKey, Dict]:
 
     var_info = {}
 
-    var_clocks = {k: v for k, v in dataset.xsimlab.output_vars.items()}
+    var_clocks = {k: v for k, v in output_vars.items()}
     var_clocks.update({vk: None for vk in model.index_vars})
 
     for var_key, clock in var_clocks.items():
@@ -35,13 +36,15 @@ def _get_var_info(
         )
 
         # encoding defined in model variable + update
-        v_encoding = var_cache["metadata"]["encoding"]
-        v_encoding.update(run_encoding)
+        # (don't mutate the variable metadata shared with the process class)
+        v_encoding = {**var_cache["metadata"]["encoding"], **run_encoding}
 
         var_info[var_key] = {
             "clock": clock,
             "name": var_cache["name"],
             "metadata": var_cache["metadata"],
+            # accepted dimension labels are unique per number of dimensions
+            "dims_by_ndim": {len(d): d for d in var_cache["metadata"]["dims"]},
             "encoding": v_encoding,
         }
 
@@ -58,6 +61,7 @@ def ensure_no_dataset_conflict(zgroup, znames):
         )
 
 
+@functools.lru_cache(maxsize=None)
 def default_fill_value_from_dtype(dtype=None):
     if dtype is None:
         return 0
@@ -106,6 +110,52 @@ class DummyLock:
         return False
 
 
+class _OutputBuffer:
+    """In-memory buffer holding the values of a clock-dependent output
+    variable for a contiguous range of clock indices.
+
+    Values are written to the zarr dataset all at once when the buffer is
+    flushed, i.e., the zarr dataset is updated once per chunk along the clock
+    dimension instead of once per saved step.
+
+    """
+
+    __slots__ = ("start", "count", "shape", "data")
+
+    def __init__(self, start, length, shape, dtype, fill_value):
+        self.start = start
+        self.count = 0
+        self.shape = tuple(shape)
+
+        buf_shape = (length,) + self.shape
+
+        if fill_value is None:
+            # padding of values smaller than the buffer is written to the store:
+            # don't leave it uninitialized (zarr also fills chunks with zeros)
+            self.data = np.zeros(buf_shape, dtype=dtype)
+        else:
+            self.data = np.full(buf_shape, fill_value, dtype=dtype)
+
+    @property
+    def full(self):
+        return self.count == self.data.shape[0]
+
+    def fits(self, shape):
+        return len(shape) == len(self.shape) and all(
+            n <= nbuf for n, nbuf in zip(shape, self.shape)
+        )
+
+    def append(self, value, shape):
+        if shape == self.shape:
+            # fast path: plain copy of the whole value (most common case)
+            self.data[self.count] = value
+        else:
+            idx = (self.count,) + tuple(slice(0, n) for n in shape)
+            self.data[idx] = value
+
+        self.count += 1
+
+
 class ZarrSimulationStore:
     def __init__(
         self,
@@ -131,8 +181,23 @@ class ZarrSimulationStore:
         else:
             self.zgroup = zarr.group(store=zobject)
 
-        self.output_vars = dataset.xsimlab.output_vars_by_clock
-        self.output_save_steps = dataset.xsimlab.get_output_save_steps()
+        xs_accessor = dataset.xsimlab
+
+        self.output_vars = xs_accessor.output_vars_by_clock
+
+        # output variables saved at some steps vs. at the end of a simulation
+        self._clock_output_vars = {
+            clock: var_keys
+            for clock, var_keys in self.output_vars.items()
+            if clock is not None
+        }
+        self._final_output_vars = self.output_vars.get(None, [])
+        self.output_save_steps = xs_accessor.get_output_save_steps()
+
+        # plain arrays avoid indexing a xarray Dataset at each step
+        self._save_steps = {
+            clock: da.values for clock, da in self.output_save_steps.data_vars.items()
+        }
 
         if encoding is None:
             encoding = {}
@@ -141,16 +206,27 @@ class ZarrSimulationStore:
 
         self.decoding = decoding
 
-        self.var_info = _get_var_info(dataset, model, encoding)
+        self.var_info = _get_var_info(xs_accessor.output_vars, model, encoding)
 
         self.batch_dim = batch_dim
         self.batch_size = get_batch_size(dataset, batch_dim)
 
-        self.mclock_dim = dataset.xsimlab.main_clock_dim
-        self.clock_sizes = dataset.xsimlab.clock_sizes
+        self.mclock_dim = xs_accessor.main_clock_dim
+        self.clock_sizes = xs_accessor.clock_sizes
 
         # initialize clock incrementers
-        self.clock_incs = self._init_clock_incrementers()
+        self.clock_incs = self._init_clock_incrementers(list(xs_accessor.clock_coords))
+
+        # in-memory buffers of clock-dependent output values, per batch and
+        # per clock (in the same order as output variable keys)
+        batch_keys = range(self.batch_size) if self.batch_dim else [-1]
+        self._buffers = {
+            batch: {
+                clock: [None] * len(var_keys)
+                for clock, var_keys in self._clock_output_vars.items()
+            }
+            for batch in batch_keys
+        }
 
         # ensure no dataset conflict in zarr group
         znames = [vi["name"] for vi in self.var_info.values()]
@@ -161,10 +237,10 @@ class ZarrSimulationStore:
         else:
             self.lock = lock
 
-    def _init_clock_incrementers(self):
+    def _init_clock_incrementers(self, clocks):
         clock_incs = {}
 
-        clock_keys = list(self.dataset.xsimlab.clock_coords) + [None]
+        clock_keys = clocks + [None]
 
         for clock in clock_keys:
             clock_incs[clock] = {}
@@ -187,7 +263,11 @@ class ZarrSimulationStore:
         ds.to_zarr(self.zgroup.store, group=self.zgroup.path, mode="a")
 
     def _create_zarr_dataset(
-        self, model: Model, var_key: VarKey, name: Optional[str] = None
+        self,
+        model: Model,
+        var_key: VarKey,
+        name: Optional[str] = None,
+        data: Optional[Any] = None,
     ):
         var_info = self.var_info[var_key]
 
@@ -197,8 +277,8 @@ class ZarrSimulationStore:
         value = model.cache[var_key]["value"]
         clock = var_info["clock"]
 
-        if "dtype" in var_info["metadata"]["encoding"]:
-            dtype = np.dtype(var_info["metadata"]["encoding"]["dtype"])
+        if "dtype" in var_info["encoding"]:
+            dtype = np.dtype(var_info["encoding"]["dtype"])
         else:
             dtype = getattr(value, "dtype", np.asarray(value).dtype)
 
@@ -230,28 +310,30 @@ class ZarrSimulationStore:
 
         try:
             # TODO: race condition? use lock?
-            zdataset = self.zgroup.create_dataset(name, **zkwargs)
+            # if given, data is written on creation (shape set from data)
+            zdataset = self.zgroup.create_dataset(name, data=data, **zkwargs)
         except ValueError as e:
             # return early if already existing dataset (batches of simulations)
             if name in self.zgroup.keys():
+                if data is not None:
+                    self.zgroup[name][:] = data
                 return
             else:
                 raise e
 
         # add dimension labels and variable attributes as metadata
-        dim_labels = None
+        ndim = len(np.shape(value))
+        dims = var_info["dims_by_ndim"].get(ndim)
 
-        for dims in var_info["metadata"]["dims"]:
-            if len(dims) == len(np.shape(value)):
-                dim_labels = list(dims)
-
-        if dim_labels is None:
+        if dims is None:
             raise ValueError(
-                f"Output array of {value.ndim} dimension(s) "
+                f"Output array of {ndim} dimension(s) "
                 f"for variable '{name}' doesn't match any of "
                 f"its accepted dimension(s): {var_info['metadata']['dims']}"
             )
 
+        dim_labels = list(dims)
+
         # set MAIN_CLOCK placeholder to main_clock dimension
         if self.mclock_dim in dim_labels and MAIN_CLOCK in dim_labels:
             raise ValueError(
@@ -265,10 +347,13 @@ class ZarrSimulationStore:
         if add_batch_dim:
             dim_labels.insert(0, self.batch_dim)
 
-        zdataset.attrs[_DIMENSION_KEY] = tuple(dim_labels)
+        # set all attributes at once (each update is written to the store)
+        zattrs = {_DIMENSION_KEY: tuple(dim_labels)}
         if var_info["metadata"]["description"]:
-            zdataset.attrs["description"] = var_info["metadata"]["description"]
-        zdataset.attrs.update(var_info["metadata"]["attrs"])
+            zattrs["description"] = var_info["metadata"]["description"]
+        zattrs.update(var_info["metadata"]["attrs"])
+
+        zdataset.attrs.put(zattrs)
 
         # reset consolidated since metadata has just been updated
         self.consolidated = False
@@ -301,52 +386,134 @@ class ZarrSimulationStore:
             with self.lock:
                 self.zgroup[zkey].resize(new_shape)
 
+    def _new_output_buffer(self, var_key: VarKey, clock_inc: int) -> _OutputBuffer:
+        var_info = self.var_info[var_key]
+        zdataset = self.zgroup[var_info["name"]]
+
+        # skip batch dimension (if any)
+        axis = 0 if self.batch_dim is None else 1
+        clock_chunk = zdataset.chunks[axis]
+
+        # buffer up to the end of the current chunk along the clock dimension
+        length = min(
+            clock_chunk - clock_inc % clock_chunk,
+            self.clock_sizes[var_info["clock"]] - clock_inc,
+        )
+
+        return _OutputBuffer(
+            clock_inc,
+            length,
+            zdataset.shape[axis + 1 :],
+            zdataset.dtype,
+            zdataset.fill_value,
+        )
+
+    def _flush_output_buffer(self, var_key: VarKey, buffer: _OutputBuffer, batch: int):
+        if not buffer.count:
+            return
+
+        idx_dims = [slice(buffer.start, buffer.start + buffer.count)]
+        idx_dims += [slice(0, n) for n in buffer.shape]
+        if batch != -1:
+            idx_dims.insert(0, batch)
+
+        zkey = self.var_info[var_key]["name"]
+        self.zgroup[zkey][tuple(idx_dims)] = buffer.data[: buffer.count]
+
+    def _write_to_output_buffers(
+        self,
+        model: Model,
+        clock: str,
+        var_keys: List[VarKey],
+        values: List[Any],
+        batch: int,
+        clock_inc: int,
+    ):
+        buffers = self._buffers[batch][clock]
+
+        for i, (vk, value) in enumerate(zip(var_keys, values)):
+            shape = np.shape(value)
+            buffer = buffers[i]
+
+            if buffer is None or buffer.full or not buffer.fits(shape):
+                if buffer is not None:
+                    self._flush_output_buffer(vk, buffer, batch)
+
+                self._maybe_resize_zarr_dataset(model, vk)
+                buffer = self._new_output_buffer(vk, clock_inc)
+                buffers[i] = buffer
+
+            buffer.append(value, shape)
+
+    def _write_final_output_vars(self, model: Model, batch: int):
+        var_keys = self._final_output_vars
+
+        if not var_keys:
+            return
+
+        clock_inc = self.clock_incs[None][batch]
+
+        values = [model.update_cache(vk) for vk in var_keys]
+
+        if clock_inc == 0:
+            for vk in var_keys:
+                with self.lock:
+                    self._create_zarr_dataset(model, vk)
+
+        for vk, value in zip(var_keys, values):
+            zkey = self.var_info[vk]["name"]
+
+            self._maybe_resize_zarr_dataset(model, vk)
+
+            if batch != -1:
+                idx = batch
+            elif np.isscalar(value):
+                idx = tuple()
+            else:
+                idx = slice(None)
+
+            self.zgroup[zkey][idx] = value
+
+        self.clock_incs[None][batch] += 1
+
     def write_output_vars(self, batch: int, step: int, model: Optional[Model] = None):
         if model is None:
             model = self.model
 
-        save_istep = self.output_save_steps.isel(**{self.mclock_dim: step})
-
-        for clock, var_keys in self.output_vars.items():
-            if clock is None and step != -1:
-                continue
-            if not save_istep.data_vars.get(clock, True):
+        for clock, var_keys in self._clock_output_vars.items():
+            save_steps = self._save_steps.get(clock)
+            if save_steps is not None and not save_steps[step]:
                 continue
 
             clock_inc = self.clock_incs[clock][batch]
 
-            for vk in var_keys:
-                model.update_cache(vk)
+            values = [model.update_cache(vk) for vk in var_keys]
 
             if clock_inc == 0:
                 for vk in var_keys:
                     with self.lock:
                         self._create_zarr_dataset(model, vk)
 
-            for vk in var_keys:
-                zkey = self.var_info[vk]["name"]
-                value = model.cache[vk]["value"]
-
-                self._maybe_resize_zarr_dataset(model, vk)
-
-                if clock is None:
-                    if batch != -1:
-                        idx = batch
-                    elif np.isscalar(value):
-                        idx = tuple()
-                    else:
-                        idx = slice(None)
+            self._write_to_output_buffers(
+                model, clock, var_keys, values, batch, clock_inc
+            )
 
-                else:
-                    idx_dims = [clock_inc] + [slice(0, n) for n in np.shape(value)]
-                    if batch != -1:
-                        idx_dims.insert(0, batch)
+            self.clock_incs[clock][batch] += 1
 
-                    idx = tuple(idx_dims)
+        # end of simulation
+        if step == -1:
+            self._write_final_output_vars(model, batch)
 
-                self.zgroup[zkey][idx] = value
+    def flush(self, batch: int = -1):
+        """Write all the output values that are still buffered in memory
+        for a given simulation (batch) into their zarr datasets.
 
-            self.clock_incs[clock][batch] += 1
+        """
+        for clock, buffers in self._buffers[batch].items():
+            for i, vk in enumerate(self.output_vars[clock]):
+                if buffers[i] is not None:
+                    self._flush_output_buffer(vk, buffers[i], batch)
+                    buffers[i] = None
 
     def write_index_vars(self, model: Optional[Model] = None):
         if model is None:
@@ -354,10 +521,9 @@ class ZarrSimulationStore:
 
         for var_key in model.index_vars:
             _, vname = var_key
-            model.update_cache(var_key)
+            value = model.update_cache(var_key)
 
-            self._create_zarr_dataset(model, var_key, name=vname)
-            self.zgroup[vname][:] = model.cache[var_key]["value"]
+            self._create_zarr_dataset(model, var_key, name=vname, data=value)
 
     def consolidate(self):
         zarr.consolidate_metadata(self.zgroup.store)
@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 import pytest
 import xarray as xr
+import zarr
 
 import xsimlab as xs
 from xsimlab.drivers import (
@@ -148,3 +149,63 @@ def test_finalize_always_called():
         pass
 
     assert model.state[("p", "var")] == "finalized"
+
+
+def test_partial_outputs_written_on_error(tmpdir):
+    @xs.process
+    class P:
+        a = xs.variable(intent="out")
+
+        @xs.runtime(args="step")
+        def run_step(self, step):
+            if step == 7:
+                raise RuntimeError("error at step 7")
+            self.a = step + 1.0
+
+    model = xs.Model({"p": P})
+    in_dataset = xs.create_setup(
+        model=model, clocks={"clock": range(20)}, output_vars={"p__a": "clock"}
+    )
+    driver = XarraySimulationDriver(in_dataset, model, store=str(tmpdir))
+
+    with pytest.raises(RuntimeError, match="error at step 7"):
+        driver.run_model()
+
+    zgroup = zarr.open_group(str(tmpdir), mode="r")
+    np.testing.assert_array_equal(zgroup.p__a[:7], np.arange(1, 8))
+    assert np.all(np.isnan(zgroup.p__a[7:]))
+
+
+def test_flush_error_does_not_hide_simulation_error(mocker):
+    @xs.process
+    class P:
+        def run_step(self):
+            raise RuntimeError("simulation error")
+
+    model = xs.Model({"p": P})
+    in_dataset = xs.create_setup(model=model, clocks={"clock": [0, 1]})
+    driver = XarraySimulationDriver(in_dataset, model)
+
+    mocker.patch.object(driver.store, "flush", side_effect=OSError("flush error"))
+
+    with pytest.raises(RuntimeError, match="simulation error"):
+        driver.run_model()
+
+
+def test_failed_flush_not_retried(mocker):
+    @xs.process
+    class P:
+        pass
+
+    model = xs.Model({"p": P})
+    in_dataset = xs.create_setup(model=model, clocks={"clock": [0, 1]})
+    driver = XarraySimulationDriver(in_dataset, model)
+
+    flush = mocker.patch.object(
+        driver.store, "flush", side_effect=OSError("flush error")
+    )
+
+    with pytest.raises(OSError, match="flush error"):
+        driver.run_model()
+
+    flush.assert_called_once()
@@ -261,8 +261,9 @@ class TestModel:
 
     def test_update_cache(self, model):
         model.state[("init_profile", "n_points")] = 10
-        model.update_cache(("init_profile", "n_points"))
+        value = model.update_cache(("init_profile", "n_points"))
 
+        assert value == 10
         assert model.cache[("init_profile", "n_points")]["value"] == 10
 
         # test on demand variables
@@ -277,6 +278,15 @@ class TestModel:
         with pytest.raises(TypeError, match=r".*'int'.*"):
             model.validate(["roll"])
 
+        with pytest.raises(TypeError, match=r".*'int'.*"):
+            model.validate()
+
+        attr.set_run_validators(False)
+        try:
+            model.validate()
+        finally:
+            attr.set_run_validators(True)
+
     def test_clone(self, model):
         cloned = model.clone()
 
@@ -25,6 +25,28 @@ def test_get_process_cls(example_process_obj):
     assert get_process_cls(example_process_obj) is p_cls
 
 
+def test_process_cls_variables():
+    p_cls = get_process_cls(ExampleProcess)
+
+    expected = [
+        "in_var",
+        "out_var",
+        "inout_var",
+        "od_var",
+        "obj_var",
+        "in_foreign_var",
+        "in_foreign_var2",
+        "out_foreign_var",
+        "in_foreign_od_var",
+        "in_global_var",
+        "out_global_var",
+        "group_var",
+        "group_dict_var",
+    ]
+    assert [name for name, _ in p_cls.__xsimlab_vars__] == expected
+    assert all(isinstance(var, attr.Attribute) for _, var in p_cls.__xsimlab_vars__)
+
+
 def test_get_process_obj(example_process_obj):
     p_cls = get_process_cls(ExampleProcess)
     assert type(get_process_obj(ExampleProcess)) is p_cls
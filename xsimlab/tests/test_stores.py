@@ -4,7 +4,11 @@ import xarray as xr
 import zarr
 
 import xsimlab as xs
-from xsimlab.stores import DummyLock, ZarrSimulationStore
+from xsimlab.stores import (
+    DummyLock,
+    ZarrSimulationStore,
+    default_fill_value_from_dtype,
+)
 from zarr.util import object_codecs
 
 
@@ -54,6 +58,25 @@ def store_batch(in_ds_batch, model, zobject):
     return ZarrSimulationStore(in_ds_batch, model, zobject=zobject, batch_dim="batch")
 
 
+@pytest.mark.parametrize(
+    "dtype,expected",
+    [
+        (None, 0),
+        (np.dtype("int32"), np.iinfo("int32").max),
+        (np.dtype("uint8"), 255),
+        (np.dtype("U3"), ""),
+        (np.dtype("bool"), 0),
+    ],
+)
+def test_default_fill_value_from_dtype(dtype, expected):
+    assert default_fill_value_from_dtype(dtype) == expected
+
+
+def test_default_fill_value_from_dtype_float_complex():
+    assert np.isnan(default_fill_value_from_dtype(np.dtype("float64")))
+    assert all(np.isnan(default_fill_value_from_dtype(np.dtype("complex128"))))
+
+
 def test_dummy_lock():
     lock = DummyLock()
 
@@ -108,6 +131,7 @@ class TestZarrSimulationStore:
         model.state[("add", "offset")] = 2.0
 
         store.write_output_vars(-1, 0)
+        store.flush()
 
         ztest = zarr.open_group(store.zgroup.store, mode="r")
 
@@ -124,6 +148,7 @@ class TestZarrSimulationStore:
 
         # test save main clock but not out clock
         store.write_output_vars(-1, 1)
+        store.flush()
         np.testing.assert_array_equal(ztest.profile__u[1], np.array([1.0, 2.0, 3.0]))
         np.testing.assert_array_equal(
             ztest.roll__u_diff[1], np.array([np.nan, np.nan, np.nan])
@@ -157,6 +182,8 @@ class TestZarrSimulationStore:
 
         store_batch.write_output_vars(0, 0, model=model_batch1)
         store_batch.write_output_vars(1, 0, model=model_batch2)
+        store_batch.flush(0)
+        store_batch.flush(1)
 
         ztest = zarr.open_group(store_batch.zgroup.store, mode="r")
 
@@ -173,6 +200,41 @@ class TestZarrSimulationStore:
         # test default chunk size along batch dim
         assert ztest.profile__u.chunks[0] == 1
 
+    def test_write_output_vars_buffered(self):
+        @xs.process
+        class P:
+            arr = xs.variable(dims="x", intent="out")
+
+        model = xs.Model({"p": P})
+
+        in_ds = xs.create_setup(
+            model=model,
+            clocks={"clock": range(5)},
+            output_vars={"p__arr": "clock"},
+        )
+
+        store = ZarrSimulationStore(in_ds, model, encoding={"p__arr": {"chunks": 2}})
+        ztest = zarr.open_group(store.zgroup.store, mode="r")
+
+        model.state[("p", "arr")] = np.array([1.0])
+        store.write_output_vars(-1, 0)
+
+        # values are kept in memory until a chunk is complete
+        assert np.isnan(ztest.p__arr[0, 0])
+
+        store.write_output_vars(-1, 1)
+        store.write_output_vars(-1, 2)
+        np.testing.assert_array_equal(ztest.p__arr[:2, 0], [1.0, 1.0])
+        assert np.isnan(ztest.p__arr[2, 0])
+
+        store.flush()
+        np.testing.assert_array_equal(ztest.p__arr[:3, 0], [1.0, 1.0, 1.0])
+
+        # flushed values are not written again
+        store.zgroup["p__arr"][:3, 0] = 0.0
+        store.flush()
+        np.testing.assert_array_equal(ztest.p__arr[:3, 0], [0.0, 0.0, 0.0])
+
     def test_write_index_vars(self, store):
         store.model.state[("init_profile", "x")] = np.array([1.0, 2.0, 3.0])
 
@@ -236,6 +298,7 @@ class TestZarrSimulationStore:
             model.state[("p", "arr")] = np.ones(size)
             store.write_output_vars(-1, step)
 
+        store.flush()
         ztest = zarr.open_group(store.zgroup.store, mode="r")
 
         expected = np.array(
@@ -243,6 +306,73 @@ class TestZarrSimulationStore:
         )
         np.testing.assert_array_equal(ztest.p__arr, expected)
 
+    def test_write_output_vars_shrink_no_fill_value(self):
+        @xs.process
+        class P:
+            arr = xs.variable(dims="x", intent="out", encoding={"fill_value": None})
+
+        model = xs.Model({"p": P})
+
+        in_ds = xs.create_setup(
+            model=model,
+            clocks={"clock": range(4)},
+            output_vars={"p__arr": "clock"},
+        )
+
+        store = ZarrSimulationStore(in_ds, model)
+
+        # value shape shrinks within the same chunk
+        for step, size in zip([0, 1, 2, 3], [3, 1, 2, 1]):
+            model.state[("p", "arr")] = np.ones(size)
+            store.write_output_vars(-1, step)
+
+        store.flush()
+        ztest = zarr.open_group(store.zgroup.store, mode="r")
+
+        expected = np.array(
+            [[1.0, 1.0, 1.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [1.0, 0.0, 0.0]]
+        )
+        np.testing.assert_array_equal(ztest.p__arr, expected)
+
+    def test_write_output_vars_shrink_batch(self):
+        @xs.process
+        class P:
+            arr = xs.variable(dims="x", intent="out", encoding={"fill_value": None})
+
+        model = xs.Model({"p": P})
+
+        in_ds = xs.create_setup(
+            model=model,
+            clocks={"clock": range(3)},
+            output_vars={"p__arr": "clock"},
+        )
+        in_ds["dummy"] = ("batch", [0, 1])
+
+        store = ZarrSimulationStore(in_ds, model, batch_dim="batch")
+        models = [model.clone(), model.clone()]
+
+        # each batch has its own value shapes, shrinking within the chunk
+        # (same initial shape: zarr doesn't initialize chunks never written
+        # when fill_value=None)
+        batch_sizes = [[3, 1, 2], [3, 2, 1]]
+
+        for step in range(3):
+            for batch, (m, sizes) in enumerate(zip(models, batch_sizes)):
+                m.state[("p", "arr")] = np.ones(sizes[step]) * (batch + 1)
+                store.write_output_vars(batch, step, model=m)
+
+        store.flush(0)
+        store.flush(1)
+        ztest = zarr.open_group(store.zgroup.store, mode="r")
+
+        expected = np.array(
+            [
+                [[1.0, 1.0, 1.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0]],
+                [[2.0, 2.0, 2.0], [2.0, 2.0, 0.0], [2.0, 0.0, 0.0]],
+            ]
+        )
+        np.testing.assert_array_equal(ztest.p__arr, expected)
+
     def test_encoding(self):
         @xs.process
         class P:
@@ -286,6 +416,9 @@ class TestZarrSimulationStore:
         assert ztest.p__v3.chunks == (10,)
         assert ztest.p__v4[0] == {"foo": "bar"}
 
+        # test variable metadata not updated with ZarrSimulationStore encoding
+        assert xs.filter_variables(P)["v2"].metadata["encoding"] == {"fill_value": 0}
+
     def test_fill_values(self):
         @xs.process
         class Foo:
@@ -332,6 +465,7 @@ class TestZarrSimulationStore:
 
         store.write_output_vars(-1, 0)
         store.write_output_vars(-1, -1)
+        store.flush()
 
         ds = store.open_as_xr_dataset()
 